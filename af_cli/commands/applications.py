@@ -2,138 +2,157 @@
 CLI commands for managing registered applications.
 """
 
-import json
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Tuple
 
 import httpx
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 
+from af_cli.core import jsonlib
 from af_cli.core.config import get_config
+from af_cli.core.http import create_async_http_client, get_http_client
 from af_cli.core.output import print_output
 
 app = typer.Typer(help="Manage registered applications")
 console = Console()
 
+# ETag of the last server application list that local files were synced against
+_SYNC_ETAG_FILE = Path.home() / ".af" / "applications" / ".etag"
 
-@app.command("register")
-def register_application(
-    app_id: str = typer.Option(..., "--app-id", help="Application identifier (no spaces)"),
-    connections: str = typer.Option(..., "--connections", help="Tool connections (format: 'tool1:conn-id,tool2:conn-id')"),
-    scopes: Optional[str] = typer.Option(None, "--scopes", help="Scopes (format: 'scope1,scope2,scope3')"),
-):
+# Column titles and styles for the 'applications list' table
+_LIST_COLUMNS = (
+    ("App ID", "cyan"),
+    ("Created", "green"),
+    ("Tool Connections", "magenta"),
+    ("Config File", "white"),
+)
+
+
+@functools.cache
+def _sdk():
+    """Import af_sdk on first use (it pulls in pydantic, OpenTelemetry, etc.)."""
+    import af_sdk
+    return af_sdk
+
+
+def _print_lines(*lines: Tuple[str, str]) -> None:
     """
-    Step 1: Register a new application (returns activation token).
-    
-    This registers your application and returns a temporary activation token
-    that expires in 1 hour. Use this token with 'afctl applications connect'
-    to complete the setup and save credentials locally.
-    
-    Example:
-        afctl applications register \\
-            --app-id my-slack-bot \\
-            --connections slack:my-slack-conn,github:my-github-conn \\
-            --scopes slack:read,slack:write,github:repo:read
+    Print several (text, style) lines with a single console write.
+
+    Lines are rendered like console.print() would render them on their own,
+    with markup, emoji codes and highlighting applied.
     """
-    config = get_config()
-    
-    if not config.is_authenticated():
-        console.print("❌ Not authenticated. Run 'afctl auth login' first.", style="red")
-        raise typer.Exit(1)
-    
-    # Parse connections
-    tool_connections = {}
-    if connections:
-        for conn_pair in connections.split(","):
-            try:
-                tool, conn_id = conn_pair.split(":")
-                tool_connections[conn_id] = []  # Will add scopes below
-            except ValueError:
-                console.print(f"❌ Invalid connection format: '{conn_pair}'. Use 'tool:conn-id'", style="red")
-                raise typer.Exit(1)
+    console.print(Group(*(console.render_str(text, style=style) for text, style in lines)))
+
+
+def _extract_error_detail(response: httpx.Response) -> str:
+    """Get the error detail from a gateway error response, decoding the body once."""
+    try:
+        detail = jsonlib.loads(response.content).get("detail")
+    except (ValueError, AttributeError):
+        # Body is not a JSON object
+        return response.text
+    return detail or response.text
+
+
+def _parse_tool_connections(connections: Optional[str], scopes: Optional[str]) -> dict:
+    """Parse 'tool:conn-id,...' and 'scope,...' strings into a tool_connections dict."""
+    if not connections:
+        return {}
+    
+    # Parse connections (connection IDs may themselves contain ':')
+    conn_ids = []
+    for conn_pair in connections.split(","):
+        tool, sep, conn_id = conn_pair.partition(":")
+        if not (sep and tool and conn_id):
+            console.print(f"❌ Invalid connection format: '{conn_pair}'. Use 'tool:conn-id'", style="red")
+            raise typer.Exit(1)
+        conn_ids.append(conn_id)
     
     # Parse scopes and assign to connections
-    if scopes:
-        scope_list = [s.strip() for s in scopes.split(",")]
-        # For simplicity, assign all scopes to all connections
-        # In production, you might want per-connection scopes
-        for conn_id in tool_connections:
-            tool_connections[conn_id] = scope_list
-    
+    # For simplicity, assign all scopes to all connections
+    # In production, you might want per-connection scopes
+    scope_list = [s.strip() for s in scopes.split(",")] if scopes else []
+    return dict.fromkeys(conn_ids, scope_list)
+
+
+def _batch_list_option(value: Any, field: str) -> Optional[str]:
+    """
+    Get a comma-separated option from a batch operation.
+
+    Accepts the command-line form (a string) or a list of strings, which is
+    joined with ','.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return ",".join(value)
+    raise ValueError(f"Field '{field}' must be a string or a list of strings")
+
+
+def _do_register(client: httpx.Client, config, app_id: str, tool_connections: dict) -> None:
+    """Register an application and print its activation token."""
     # Make API request to register (returns activation token)
     try:
-        response = httpx.post(
-            f"{config.gateway_url}/api/v1/applications/register",
-            headers={"Authorization": f"Bearer {config.access_token}"},
-            json={
+        response = client.post(
+            "/api/v1/applications/register",
+            headers={
+                "Authorization": f"Bearer {config.access_token}",
+                "Content-Type": "application/json",
+            },
+            content=jsonlib.dumps({
                 "app_id": app_id,
                 "tool_connections": tool_connections
-            },
-            timeout=30.0
+            }),
         )
         
         if response.status_code != 201:
-            error_detail = response.text
-            try:
-                error_json = response.json()
-                error_detail = error_json.get("detail", response.text)
-            except:
-                pass
-            
+            error_detail = _extract_error_detail(response)
             console.print(f"❌ Failed to register application: {error_detail}", style="red")
             raise typer.Exit(1)
         
-        data = response.json()
+        data = jsonlib.loads(response.content)
         
         # Display activation token
-        console.print("\n✅ Application registered successfully!", style="green bold")
-        console.print(f"\n📋 App ID: {data['app_id']}", style="cyan")
-        console.print(f"\n🔑 Activation Token:", style="yellow bold")
-        console.print(f"   {data['activation_token']}", style="yellow")
-        console.print(f"\n⏰ Token expires: {data['expires_at'][:19]} UTC", style="white")
-        console.print(f"   (Valid for 1 hour)", style="dim")
-        
-        console.print("\n📋 Next Steps:", style="cyan bold")
-        console.print(f"   1. Navigate to your project directory", style="white")
-        console.print(f"   2. Make sure you're authenticated: afctl auth login", style="white")
-        console.print(f"   3. Run the connect command:", style="white")
-        console.print(f"\n      afctl applications connect {app_id} --token <activation-token>", style="green")
-        console.print(f"\n⚠️  Save the activation token! It expires in 1 hour and can only be used once.", style="yellow bold")
+        _print_lines(
+            ("\n✅ Application registered successfully!", "green bold"),
+            (f"\n📋 App ID: {data['app_id']}", "cyan"),
+            ("\n🔑 Activation Token:", "yellow bold"),
+            (f"   {data['activation_token']}", "yellow"),
+            (f"\n⏰ Token expires: {data['expires_at'][:19]} UTC", "white"),
+            ("   (Valid for 1 hour)", "dim"),
+            ("\n📋 Next Steps:", "cyan bold"),
+            ("   1. Navigate to your project directory", "white"),
+            ("   2. Make sure you're authenticated: afctl auth login", "white"),
+            ("   3. Run the connect command:", "white"),
+            (f"\n      afctl applications connect {app_id} --token <activation-token>", "green"),
+            ("\n⚠️  Save the activation token! It expires in 1 hour and can only be used once.", "yellow bold"),
+        )
         
     except httpx.HTTPError as e:
         console.print(f"❌ Network error: {e}", style="red")
         raise typer.Exit(1)
 
 
-@app.command("connect")
-def connect_application(
-    app_id: str = typer.Argument(..., help="Application identifier"),
-    token: str = typer.Option(..., "--token", help="Activation token from registration"),
-):
-    """
-    Step 2: Connect/activate an application (saves credentials locally).
-    
-    Uses the activation token from 'afctl applications register' to activate
-    the application and save credentials to the current directory.
-    
-    Example:
-        afctl applications connect my-slack-bot --token <activation-token>
-    """
-    config = get_config()
-    
-    if not config.is_authenticated():
-        console.print("❌ Not authenticated. Run 'afctl auth login' first.", style="red")
-        raise typer.Exit(1)
-    
+def _do_connect(client: httpx.Client, config, token: str) -> None:
+    """Activate an application and save its credentials locally."""
     # Make API request to activate (returns final credentials)
     try:
-        response = httpx.post(
-            f"{config.gateway_url}/api/v1/applications/activate",
-            headers={"Authorization": f"Bearer {config.access_token}"},
-            json={"activation_token": token},
-            timeout=30.0
+        response = client.post(
+            "/api/v1/applications/activate",
+            headers={
+                "Authorization": f"Bearer {config.access_token}",
+                "Content-Type": "application/json",
+            },
+            content=jsonlib.dumps({"activation_token": token}),
         )
         
         if response.status_code == 404:
@@ -145,21 +164,13 @@ def connect_application(
             console.print("❌ This activation token does not belong to you", style="red")
             raise typer.Exit(1)
         elif response.status_code != 201:
-            error_detail = response.text
-            try:
-                error_json = response.json()
-                error_detail = error_json.get("detail", response.text)
-            except:
-                pass
-            
+            error_detail = _extract_error_detail(response)
             console.print(f"❌ Failed to activate application: {error_detail}", style="red")
             raise typer.Exit(1)
         
-        data = response.json()
+        data = jsonlib.loads(response.content)
         
         # Save credentials locally
-        from af_sdk import save_application_config
-        
         app_config = {
             "app_id": data["app_id"],
             "secret_key": data["secret_key"],
@@ -170,23 +181,177 @@ def connect_application(
             "gateway_url": config.gateway_url
         }
         
-        app_file = save_application_config(data["app_id"], app_config)
+        app_file = _sdk().save_application_config(data["app_id"], app_config)
         
         # Display success
-        console.print("\n✅ Application activated successfully!", style="green bold")
-        console.print(f"\n📋 App ID: {data['app_id']}", style="cyan")
-        console.print(f"🔑 Secret Key: {data['secret_key']}", style="yellow")
-        console.print(f"\n💾 Credentials saved to: {app_file}", style="green")
-        console.print("\n⚠️  Save the secret key securely! It won't be shown again.", style="yellow bold")
-        console.print("\n🚀 Your agent can now authenticate with:", style="cyan")
-        console.print(f"   from af_sdk import get_application_client", style="white")
-        console.print(f"   client = await get_application_client('{data['app_id']}')", style="white")
+        _print_lines(
+            ("\n✅ Application activated successfully!", "green bold"),
+            (f"\n📋 App ID: {data['app_id']}", "cyan"),
+            (f"🔑 Secret Key: {data['secret_key']}", "yellow"),
+            (f"\n💾 Credentials saved to: {app_file}", "green"),
+            ("\n⚠️  Save the secret key securely! It won't be shown again.", "yellow bold"),
+            ("\n🚀 Your agent can now authenticate with:", "cyan"),
+            ("   from af_sdk import get_application_client", "white"),
+            (f"   client = await get_application_client('{data['app_id']}')", "white"),
+        )
         
     except httpx.HTTPError as e:
         console.print(f"❌ Network error: {e}", style="red")
         raise typer.Exit(1)
 
 
+def _do_delete(client: httpx.Client, config, app_id: str) -> None:
+    """Delete an application on the server and remove its local credentials."""
+    # Delete from server
+    try:
+        response = client.delete(
+            f"/api/v1/applications/{app_id}",
+            headers={"Authorization": f"Bearer {config.access_token}"},
+        )
+        
+        if response.status_code == 404:
+            console.print(f"⚠️  Application '{app_id}' not found on server", style="yellow")
+        elif response.status_code != 204:
+            error_detail = _extract_error_detail(response)
+            console.print(f"❌ Failed to delete from server: {error_detail}", style="red")
+            raise typer.Exit(1)
+        else:
+            console.print(f"✅ Deleted from server", style="green")
+        
+    except httpx.HTTPError as e:
+        console.print(f"❌ Network error: {e}", style="red")
+        raise typer.Exit(1)
+    
+    # Delete local config
+    deleted = _sdk().delete_application_config(app_id)
+    if deleted:
+        console.print(f"✅ Deleted local credentials", style="green")
+    else:
+        console.print(f"⚠️  Local credentials not found", style="yellow")
+    
+    console.print(f"\n🎉 Application '{app_id}' deleted successfully", style="green bold")
+
+
+@app.command("register")
+def register_application(
+    app_id: str = typer.Option(..., "--app-id", help="Application identifier (no spaces)"),
+    connections: str = typer.Option(..., "--connections", help="Tool connections (format: 'tool1:conn-id,tool2:conn-id')"),
+    scopes: Optional[str] = typer.Option(None, "--scopes", help="Scopes (format: 'scope1,scope2,scope3')"),
+):
+    """
+    Step 1: Register a new application (returns activation token).
+    
+    This registers your application and returns a temporary activation token
+    that expires in 1 hour. Use this token with 'afctl applications connect'
+    to complete the setup and save credentials locally.
+    
+    Example:
+        afctl applications register \\
+            --app-id my-slack-bot \\
+            --connections slack:my-slack-conn,github:my-github-conn \\
+            --scopes slack:read,slack:write,github:repo:read
+    """
+    config = get_config()
+    
+    if not config.is_authenticated():
+        console.print("❌ Not authenticated. Run 'afctl auth login' first.", style="red")
+        raise typer.Exit(1)
+    
+    tool_connections = _parse_tool_connections(connections, scopes)
+    _do_register(get_http_client(), config, app_id, tool_connections)
+
+
+@app.command("connect")
+def connect_application(
+    app_id: str = typer.Argument(..., help="Application identifier"),
+    token: str = typer.Option(..., "--token", help="Activation token from registration"),
+):
+    """
+    Step 2: Connect/activate an application (saves credentials locally).
+    
+    Uses the activation token from 'afctl applications register' to activate
+    the application and save credentials to the current directory.
+    
+    Example:
+        afctl applications connect my-slack-bot --token <activation-token>
+    """
+    config = get_config()
+    
+    if not config.is_authenticated():
+        console.print("❌ Not authenticated. Run 'afctl auth login' first.", style="red")
+        raise typer.Exit(1)
+    
+    _do_connect(get_http_client(), config, token)
+
+
+def _read_sync_etag() -> Optional[str]:
+    """Read the ETag saved by the last successful sync, if any."""
+    try:
+        return _SYNC_ETAG_FILE.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _write_sync_etag(etag: str) -> None:
+    """Save the ETag of a server application list that local files now match."""
+    try:
+        _SYNC_ETAG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _SYNC_ETAG_FILE.write_text(etag)
+    except OSError:
+        pass
+
+
+async def _fetch_server_app_ids(
+    client: httpx.AsyncClient,
+    access_token: str,
+    etag: Optional[str] = None,
+) -> Tuple[Optional[set], Optional[str]]:
+    """
+    Fetch the IDs of the applications registered on the server.
+    
+    Only the ID set is kept; the decoded response is released as soon as it
+    has been read. When ``etag`` is given the request is conditional.
+    
+    Returns:
+        (app_ids, etag) - app_ids is None if the list could not be fetched or
+        is unchanged since ``etag`` (HTTP 304); etag is the new list's ETag
+    """
+    headers = {"Authorization": f"Bearer {access_token}"}
+    if etag:
+        headers["If-None-Match"] = etag
+    
+    try:
+        response = await client.get("/api/v1/applications", headers=headers)
+    except httpx.HTTPError as e:
+        # If server check fails, just show local apps with a warning
+        console.print(f"⚠️  Could not sync with server: {e}", style="yellow")
+        return None, None
+    
+    # 304 Not Modified: local files were already synced against this list
+    if response.status_code != 200:
+        return None, None
+    
+    try:
+        app_ids = {app["app_id"] for app in jsonlib.loads(response.content).get("applications", ())}
+    except (ValueError, AttributeError, KeyError, TypeError):
+        # Silently skip the sync if the response is malformed
+        return None, None
+    
+    return app_ids, response.headers.get("ETag")
+
+
+async def _load_applications(list_local_apps, access_token: Optional[str], etag: Optional[str]):
+    """Scan local config files, fetching the server list concurrently if requested."""
+    if access_token is None:
+        return await asyncio.to_thread(list_local_apps), (None, None)
+    
+    async with create_async_http_client() as client:
+        return await asyncio.gather(
+            asyncio.to_thread(list_local_apps),
+            _fetch_server_app_ids(client, access_token, etag),
+        )
+
+
 @app.command("list")
 def list_applications(
     format: str = typer.Option("table", "--format", help="Output format (table, json, yaml)"),
@@ -200,42 +365,35 @@ def list_applications(
     deleted from the server (e.g., via the UI).
     """
     config = get_config()
-    
-    # Load from local config first
-    from af_sdk import list_applications as list_local_apps, delete_application_config
-    
-    local_apps = list_local_apps()
-    
-    # If sync is enabled and user is authenticated, check server and clean up orphans
-    if sync and config.is_authenticated():
+    sdk = _sdk()
+    
+    # If sync is enabled and user is authenticated, fetch the server list
+    # while the local config files are being read
+    access_token = config.access_token if sync and config.is_authenticated() else None
+    etag = _read_sync_etag() if access_token else None
+    local_apps, (server_app_ids, new_etag) = asyncio.run(
+        _load_applications(sdk.list_applications, access_token, etag)
+    )
+    
+    # Clean up local files for applications deleted on the server
+    if server_app_ids is not None:
         try:
-            response = httpx.get(
-                f"{config.gateway_url}/api/v1/applications",
-                headers={"Authorization": f"Bearer {config.access_token}"},
-                timeout=30.0
-            )
+            # Find and remove orphaned local files
+            orphaned = [a["app_id"] for a in local_apps if a["app_id"] not in server_app_ids]
             
-            if response.status_code == 200:
-                data = response.json()
-                server_apps = data.get("applications", [])
-                server_app_ids = {app["app_id"] for app in server_apps}
+            if orphaned:
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    list(executor.map(sdk.delete_application_config, orphaned))
                 
-                # Find and remove orphaned local files
-                orphaned = []
-                for local_app in local_apps[:]:  # Copy list to modify during iteration
-                    if local_app["app_id"] not in server_app_ids:
-                        orphaned.append(local_app["app_id"])
-                        # Delete orphaned local config
-                        delete_application_config(local_app["app_id"])
-                        # Remove from local_apps list
-                        local_apps.remove(local_app)
+                orphan_ids = set(orphaned)
+                local_apps = [a for a in local_apps if a["app_id"] not in orphan_ids]
                 
-                if orphaned:
-                    console.print(f"🧹 Cleaned up {len(orphaned)} orphaned local file(s): {', '.join(orphaned)}", style="yellow")
+                console.print(f"🧹 Cleaned up {len(orphaned)} orphaned local file(s): {', '.join(orphaned)}", style="yellow")
+            
+            # Only remember the list once local files match it
+            if new_etag:
+                _write_sync_etag(new_etag)
             
-        except httpx.HTTPError as e:
-            # If server check fails, just show local apps with a warning
-            console.print(f"⚠️  Could not sync with server: {e}", style="yellow")
         except Exception as e:
             # Silently continue if sync fails
             pass
@@ -246,10 +404,8 @@ def list_applications(
             return
         
         table = Table(title="Registered Applications")
-        table.add_column("App ID", style="cyan")
-        table.add_column("Created", style="green")
-        table.add_column("Tool Connections", style="magenta")
-        table.add_column("Config File", style="white")
+        for name, style in _LIST_COLUMNS:
+            table.add_column(name, style=style)
         
         for app in local_apps:
             conn_count = len(app.get("tool_connections", {}))
@@ -285,11 +441,11 @@ def show_application(
         afctl applications show my-slack-bot
         afctl applications show my-slack-bot --reveal-secret
     """
-    from af_sdk import load_application_config, ApplicationNotFoundError
+    sdk = _sdk()
     
     try:
-        app_config = load_application_config(app_id)
-    except ApplicationNotFoundError as e:
+        app_config = sdk.load_application_config(app_id)
+    except sdk.ApplicationNotFoundError as e:
         console.print(f"❌ {e}", style="red")
         raise typer.Exit(1)
     
@@ -355,78 +511,150 @@ def delete_application(
             console.print("❌ Cancelled", style="yellow")
             raise typer.Exit(0)
     
-    # Delete from server
+    _do_delete(get_http_client(), config, app_id)
+
+
+@app.command("batch")
+def batch_applications(
+    file: Path = typer.Argument(..., help="JSON or YAML file with a list of operations", exists=True, dir_okay=False),
+):
+    """
+    Run several register/connect/delete operations in one invocation.
+    
+    Operations run in order over a single gateway connection. Each entry
+    needs an "op" key plus the options of the matching command; deletes
+    are not confirmed.
+    
+    Example file:
+        [
+            {"op": "register", "app_id": "my-bot", "connections": "slack:my-slack", "scopes": "slack:read"},
+            {"op": "connect", "token": "<activation-token>"},
+            {"op": "delete", "app_id": "my-old-bot"}
+        ]
+    
+    Example:
+        afctl applications batch operations.json
+    """
+    config = get_config()
+    
+    if not config.is_authenticated():
+        console.print("❌ Not authenticated. Run 'afctl auth login' first.", style="red")
+        raise typer.Exit(1)
+    
     try:
-        response = httpx.delete(
-            f"{config.gateway_url}/api/v1/applications/{app_id}",
-            headers={"Authorization": f"Bearer {config.access_token}"},
-            timeout=30.0
-        )
-        
-        if response.status_code == 404:
-            console.print(f"⚠️  Application '{app_id}' not found on server", style="yellow")
-        elif response.status_code != 204:
-            error_detail = response.text
+        if file.suffix in (".yaml", ".yml"):
+            import yaml
             try:
-                error_json = response.json()
-                error_detail = error_json.get("detail", response.text)
-            except:
-                pass
-            
-            console.print(f"❌ Failed to delete from server: {error_detail}", style="red")
-            raise typer.Exit(1)
+                operations = yaml.safe_load(file.read_text())
+            except yaml.YAMLError as e:
+                # YAMLError is not a ValueError, report it like invalid JSON
+                raise ValueError(str(e)) from e
         else:
-            console.print(f"✅ Deleted from server", style="green")
-        
-    except httpx.HTTPError as e:
-        console.print(f"❌ Network error: {e}", style="red")
+            operations = jsonlib.loads(file.read_bytes())
+    except (OSError, ValueError) as e:
+        console.print(f"❌ Failed to read {file}: {e}", style="red")
         raise typer.Exit(1)
     
-    # Delete local config
-    from af_sdk import delete_application_config
+    if not isinstance(operations, list):
+        console.print("❌ Batch file must contain a list of operations", style="red")
+        raise typer.Exit(1)
     
-    deleted = delete_application_config(app_id)
-    if deleted:
-        console.print(f"✅ Deleted local credentials", style="green")
-    else:
-        console.print(f"⚠️  Local credentials not found", style="yellow")
+    client = get_http_client()
+    failed = 0
     
-    console.print(f"\n🎉 Application '{app_id}' deleted successfully", style="green bold")
+    for index, operation in enumerate(operations, start=1):
+        if not isinstance(operation, dict):
+            operation = {}
+        op = operation.get("op")
+        console.print(f"\n▶️  ({index}/{len(operations)}) {op} {operation.get('app_id', '')}", style="cyan bold")
+        
+        # Read and check fields up front so a KeyError or ValueError can only
+        # mean the batch file is missing one or has the wrong type
+        try:
+            if op in ("register", "delete"):
+                app_id = operation["app_id"]
+            if op == "register":
+                # Required, as --connections is for 'afctl applications register'
+                connections = _batch_list_option(operation.get("connections"), "connections")
+                if not connections:
+                    raise KeyError("connections")
+                scopes = _batch_list_option(operation.get("scopes"), "scopes")
+            elif op == "connect":
+                token = operation["token"]
+        except KeyError as e:
+            console.print(f"❌ Missing field {e} for '{op}' operation", style="red")
+            failed += 1
+            continue
+        except ValueError as e:
+            console.print(f"❌ {e} for '{op}' operation", style="red")
+            failed += 1
+            continue
+        
+        try:
+            if op == "register":
+                tool_connections = _parse_tool_connections(connections, scopes)
+                _do_register(client, config, app_id, tool_connections)
+            elif op == "connect":
+                _do_connect(client, config, token)
+            elif op == "delete":
+                _do_delete(client, config, app_id)
+            else:
+                console.print(f"❌ Unknown operation: '{op}'. Use 'register', 'connect' or 'delete'", style="red")
+                failed += 1
+        except typer.Exit as e:
+            if e.exit_code:
+                failed += 1
+    
+    if failed:
+        console.print(f"\n❌ {failed} of {len(operations)} operation(s) failed", style="red bold")
+        raise typer.Exit(1)
+    
+    console.print(f"\n🎉 {len(operations)} operation(s) completed successfully", style="green bold")
 
 
 @app.command("test")
 def test_application(
-    app_id: str = typer.Argument(..., help="Application identifier"),
+    app_ids: List[str] = typer.Argument(..., help="Application identifier(s)"),
 ):
     """
     Test application authentication.
     
     Attempts to exchange credentials for a token to verify the application
-    is properly registered and can authenticate.
+    is properly registered and can authenticate. When several applications
+    are given, they are tested concurrently.
     
     Example:
         afctl applications test my-slack-bot
+        afctl applications test my-slack-bot email-agent
     """
-    import asyncio
-    from af_sdk import get_application_client, ApplicationNotFoundError, AuthenticationError
+    sdk = _sdk()
     
-    async def _test():
-        try:
+    async def _test_one(http: httpx.AsyncClient, semaphore: asyncio.Semaphore, app_id: str) -> bool:
+        async with semaphore:
             console.print(f"🔄 Testing authentication for '{app_id}'...", style="cyan")
-            
-            client = await get_application_client(app_id)
-            
-            console.print(f"✅ Authentication successful!", style="green bold")
-            console.print(f"\n📋 Application: {client._app_id}", style="cyan")
-            console.print(f"⏱️  Token expires in: {client._expires_in} seconds", style="white")
-            console.print(f"\n🎉 Your application can authenticate and make API calls!", style="green")
-            
-        except ApplicationNotFoundError as e:
-            console.print(f"❌ {e}", style="red")
-            raise typer.Exit(1)
-        except AuthenticationError as e:
-            console.print(f"❌ {e}", style="red")
+            try:
+                client = await sdk.get_application_client(app_id, http_client=http)
+            except (sdk.ApplicationNotFoundError, sdk.auth.AuthenticationError) as e:
+                console.print(f"❌ {e}", style="red")
+                return False
+        
+        await client.close()
+        console.print(f"✅ Authentication successful!", style="green bold")
+        console.print(f"\n📋 Application: {client._app_id}", style="cyan")
+        console.print(f"⏱️  Token expires in: {client._expires_in} seconds", style="white")
+        return True
+    
+    async def _test():
+        semaphore = asyncio.Semaphore(10)
+        async with httpx.AsyncClient() as http:
+            results = await asyncio.gather(*(_test_one(http, semaphore, app_id) for app_id in app_ids))
+        
+        if not all(results):
             raise typer.Exit(1)
+        
+        if len(app_ids) == 1:
+            console.print(f"\n🎉 Your application can authenticate and make API calls!", style="green")
+        else:
+            console.print(f"\n🎉 All {len(app_ids)} applications can authenticate and make API calls!", style="green")
     
     asyncio.run(_test())
-
@@ -2,14 +2,104 @@
 Tool management commands for the Agentic Fabric CLI.
 """
 
+import functools
+import time
+from typing import NamedTuple, Optional, Tuple
+from urllib.parse import urlencode
 
+import httpx
 import typer
 
+from af_cli.core import jsonlib
 from af_cli.core.client import get_client
-from af_cli.core.output import debug, error, info, print_output, success, warning
+from af_cli.core.config import get_config
+from af_cli.core.connections import (
+    fetch_connections,
+    find_connection,
+    invalidate_connections,
+    recently_added_connection,
+    remember_added_connection,
+)
+from af_cli.core.output import console, debug, error, info, print_output, success, warning
 
 app = typer.Typer(help="Tool management commands")
 
+# Errors reported as a one-line failure message; anything else propagates
+_COMMAND_ERRORS = (httpx.HTTPError, OSError, ValueError, KeyError)
+
+# Status labels indexed by the connection's "connected" flag
+_STATUS_LABELS = ("○ Configured", "✓ Connected")
+
+
+# Google Workspace tools that share the "google" credential endpoints
+_GOOGLE_TOOLS = frozenset({"gmail"})
+_GOOGLE_PREFIX = "google_"
+
+
+def _is_google(tool: str) -> bool:
+    """Whether a tool is a Google Workspace tool (google_* or gmail)."""
+    return tool in _GOOGLE_TOOLS or tool.startswith(_GOOGLE_PREFIX)
+
+
+# Gateway tool names that differ by connection method; any other
+# (tool, method) pair uses the tool name itself
+_API_TOOL_NAMES = {
+    ("google", "oauth3"): "google_oauth",
+    ("notion", "oauth3"): "notion_oauth",
+}
+
+
+def _resolve_api_tool(tool: str, method: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """
+    Get the gateway tool name for a tool and connection method.
+
+    Google tools all share the "google" endpoints, so the specific tool is
+    returned as the tool_type query parameter (None for other tools).
+    """
+    if _is_google(tool):
+        return _API_TOOL_NAMES.get(("google", method), "google"), tool
+    return _API_TOOL_NAMES.get((tool, method), tool), None
+
+
+# Translation table turning tool ID separators into spaces
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@functools.cache
+def _format_tool_name(tool: str) -> str:
+    """Format a tool ID for display (e.g., "google_docs" -> "Google Docs")."""
+    return tool.translate(_UNDERSCORE_TO_SPACE).title()
+
+
+class _ConnectionRow(NamedTuple):
+    """A row of 'afctl tools list' output, in _LIST_COLUMNS order."""
+
+    tool: str
+    id: str
+    name: str
+    status: str
+    method: str
+    added: str
+
+
+# Column headings for _ConnectionRow fields
+_LIST_COLUMNS = ["Tool", "ID", "Name", "Status", "Method", "Added"]
+
+
+def _connection_rows(connections):
+    """Yield display rows for 'afctl tools list', one per connection."""
+    for conn in connections:
+        connection_id = conn.get("connection_id", "N/A")
+        created_at = conn.get("created_at")
+        yield _ConnectionRow(
+            _format_tool_name(conn.get("tool", "N/A")),
+            connection_id,
+            conn.get("display_name") or connection_id,
+            _STATUS_LABELS[bool(conn.get("connected"))],
+            conn.get("method", "oauth"),
+            created_at[:10] if created_at else "N/A",
+        )
+
 
 @app.command()
 def list(
@@ -75,7 +165,6 @@ def list(
       - Combines with search and pagination
     """
     try:
-        from af_cli.core.config import get_config
         config = get_config()
         
         # Use provided page_size, or fall back to configured default
@@ -87,20 +176,22 @@ def list(
             config.save()
         
         with get_client() as client:
-            # Build query parameters - always include all params for clarity
+            # Build query parameters, leaving out unset search/filter options
             params = {
-                "page": page,
-                "page_size": page_size,
+                key: value
+                for key, value in (
+                    ("page", page),
+                    ("page_size", page_size),
+                    ("search", search),
+                    ("tool_filter", tool_filter),
+                )
+                if value
             }
-            if search:
-                params["search"] = search
-            if tool_filter:
-                params["tool_filter"] = tool_filter
             
-            debug(f"Requesting connections with params: {params}")
+            debug("Requesting connections with params: %s", params)
             connections = client.get("/api/v1/user-connections", params=params)
             
-            debug(f"Received {len(connections) if connections else 0} connections from API")
+            debug("Received %d connections from API", len(connections) if connections else 0)
 
             if not connections:
                 if page > 1:
@@ -115,24 +206,6 @@ def list(
                     warning("No tool connections found. Add connections in the dashboard UI.")
                 return
             
-            # Format for better display
-            display_data = []
-            for conn in connections:
-                # Format tool name nicely (e.g., "google_docs" -> "Google Docs")
-                tool_name = conn.get("tool", "N/A").replace("_", " ").title()
-                
-                # Status indicator
-                status = "✓ Connected" if conn.get("connected") else "○ Configured"
-                
-                display_data.append({
-                    "Tool": tool_name,
-                    "ID": conn.get("connection_id", "N/A"),
-                    "Name": conn.get("display_name") or conn.get("connection_id", "N/A"),
-                    "Status": status,
-                    "Method": conn.get("method", "oauth"),
-                    "Added": conn.get("created_at", "N/A")[:10] if conn.get("created_at") else "N/A",
-                })
-            
             # Show pagination and filter info
             total_info = ""
             if page != 1 or page_size != 20 or search or tool_filter:
@@ -153,8 +226,9 @@ def list(
                 info(f"🔍 Filtered results: {' AND '.join(filter_parts)}")
 
             print_output(
-                display_data,
+                _connection_rows(connections),
                 format_type=format,
+                columns=_LIST_COLUMNS,
                 title=f"Your Tool Connections{total_info}"
             )
 
@@ -165,9 +239,22 @@ def list(
             if not search and not tool_filter:
                 info(f"💡 Tip: Use --search <term> to search, or --tool <type> to filter by tool type")
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to list tool connections: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
+
+
+# Tool-specific fields shown by 'afctl tools get' when present
+_DETAIL_FIELDS = (
+    ("Team Name", "team_name"),
+    ("Team ID", "team_id"),
+    ("Bot User ID", "bot_user_id"),
+    ("Email", "email"),
+    ("GitHub Login", "login"),
+    ("Workspace Name", "workspace_name"),
+)
 
 
 @app.command()
@@ -178,50 +265,38 @@ def get(
     """Get tool connection details."""
     try:
         with get_client() as client:
-            # Get all user connections and find the matching one
-            connections = client.get("/api/v1/user-connections")
-            
-            # Find the specific connection
-            connection = None
-            for conn in connections:
-                if conn.get("connection_id") == connection_id or conn.get("tool") == connection_id:
-                    connection = conn
-                    break
+            # Find the connection by ID, or by tool name
+            connection = find_connection(client, connection_id, match_tool=True)
             
             if not connection:
                 error(f"Connection '{connection_id}' not found")
-                info("Available connections:")
-                for conn in connections:
-                    info(f"  - {conn.get('tool')} (ID: {conn.get('connection_id')})")
+                info("\n".join([
+                    "Available connections:",
+                    *(f"  - {conn.get('tool')} (ID: {conn.get('connection_id')})"
+                      for conn in fetch_connections(client).items),
+                ]))
                 raise typer.Exit(1)
             
             # Format tool name nicely
-            tool_name = connection.get("tool", "N/A").replace("_", " ").title()
+            tool_name = _format_tool_name(connection.get("tool", "N/A"))
             
             # Format the connection details for display
             details = {
                 "Tool": tool_name,
                 "Connection ID": connection.get("connection_id", "N/A"),
                 "Display Name": connection.get("display_name") or connection.get("connection_id", "N/A"),
-                "Status": "✓ Connected" if connection.get("connected") else "○ Configured",
+                "Status": _STATUS_LABELS[bool(connection.get("connected"))],
                 "Method": connection.get("method", "oauth"),
                 "Created": connection.get("created_at", "N/A"),
                 "Updated": connection.get("updated_at", "N/A"),
             }
             
             # Add tool-specific fields if present
-            if connection.get("team_name"):
-                details["Team Name"] = connection.get("team_name")
-            if connection.get("team_id"):
-                details["Team ID"] = connection.get("team_id")
-            if connection.get("bot_user_id"):
-                details["Bot User ID"] = connection.get("bot_user_id")
-            if connection.get("email"):
-                details["Email"] = connection.get("email")
-            if connection.get("login"):
-                details["GitHub Login"] = connection.get("login")
-            if connection.get("workspace_name"):
-                details["Workspace Name"] = connection.get("workspace_name")
+            details.update(
+                (label, connection[key])
+                for label, key in _DETAIL_FIELDS
+                if connection.get(key)
+            )
             if connection.get("scopes"):
                 details["Scopes"] = ", ".join(connection.get("scopes", []))
             
@@ -231,9 +306,11 @@ def get(
                 title=f"{tool_name} Connection Details"
             )
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to get tool connection: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
 
 
 @app.command()
@@ -351,44 +428,47 @@ def invoke(
         # Parse parameters if provided
         parameters = {}
         if params:
-            import json as json_lib
             try:
-                parameters = json_lib.loads(params)
-            except json_lib.JSONDecodeError as e:
+                parameters = jsonlib.loads(params)
+            except ValueError as e:
                 error(f"Invalid JSON in --params: {e}")
                 raise typer.Exit(1)
         
         with get_client() as client:
             info(f"Invoking connection '{connection_id}' with method '{method}'...")
             
-            # Verify connection exists
-            connections = client.get("/api/v1/user-connections")
-            connection = next((c for c in connections if c.get("connection_id") == connection_id), None)
-            
-            if not connection:
-                error(f"Connection '{connection_id}' not found")
-                info("Available connections:")
-                for conn in connections:
-                    info(f"  - {conn.get('connection_id')} ({conn.get('tool')})")
-                raise typer.Exit(1)
-            
-            tool_name = connection.get("tool")
-            debug(f"Connection '{connection_id}' uses tool '{tool_name}'")
-            
             # Use the connection-based invoke endpoint (auto-creates tool if needed)
             data = {
                 "method": method,
                 "parameters": parameters,
             }
             
-            response = client.post(f"/api/v1/tools/connections/{connection_id}/invoke", data)
+            # The gateway validates the connection itself, so the connection
+            # list is only fetched to explain a 404
+            ok, status, response = client.try_post(f"/api/v1/tools/connections/{connection_id}/invoke", data)
+            
+            if not ok:
+                if status == 404 and find_connection(client, connection_id) is None:
+                    error(f"Connection '{connection_id}' not found")
+                    info("\n".join([
+                        "Available connections:",
+                        *(f"  - {conn.get('connection_id')} ({conn.get('tool')})"
+                          for conn in fetch_connections(client).items),
+                    ]))
+                elif status == 401:
+                    error("Authentication failed. Please run 'afctl auth login'")
+                elif status == 403:
+                    error("Access denied. Check your permissions.")
+                else:
+                    detail = response.get("detail") if isinstance(response, dict) else None
+                    error(f"API Error: {detail or f'HTTP {status}'}")
+                raise typer.Exit(1)
             
             success("Tool invoked successfully")
             
             # For tool invocations, show the result in a more readable format
             if format == "json":
-                import json as json_lib
-                print(json_lib.dumps(response, indent=2))
+                print(jsonlib.dumps_pretty(response))
             elif format == "yaml":
                 import yaml
                 print(yaml.dump(response, default_flow_style=False))
@@ -398,9 +478,45 @@ def invoke(
                 print("\n📊 Result:")
                 print_output(result, format_type="json")
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to invoke tool: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
+
+
+# Shown by 'afctl tools add google ...' (formatted with connection_id, method)
+_GOOGLE_TOOL_HELP = """
+Please specify the exact Google Workspace tool:
+  • google_drive    - Google Drive
+  • google_docs     - Google Docs
+  • google_sheets   - Google Sheets
+  • google_slides   - Google Slides
+  • gmail           - Gmail
+  • google_calendar - Google Calendar
+  • google_meet     - Google Meet
+  • google_forms    - Google Forms
+  • google_classroom - Google Classroom
+  • google_people   - Google People (Contacts)
+  • google_chat     - Google Chat
+  • google_tasks    - Google Tasks
+
+Example:
+  afctl tools add google_drive --connection-id {connection_id} --method {method}"""
+
+# Shown when api_credentials is missing credentials (formatted with tool, connection_id)
+_API_CREDENTIALS_HELP = """  • --token (for simple token auth like Notion, Slack bot)
+  • --client-id and --client-secret (for OAuth app auth like Google)
+
+Examples:
+  afctl tools add {tool} --connection-id {connection_id} --method api_credentials --token YOUR_TOKEN
+  afctl tools add {tool} --connection-id {connection_id} --method api_credentials --client-id ID --client-secret SECRET"""
+
+# Connection methods accepted by 'afctl tools add'
+_VALID_METHODS = frozenset({"api_credentials", "oauth3", "oauth"})
+
+# Tools besides the Google Workspace ones that support platform OAuth (oauth3)
+_OAUTH3_TOOLS = frozenset({"slack", "notion"})
 
 
 @app.command()
@@ -441,39 +557,21 @@ def add(
       afctl tools add slack --connection-id slack-bot --method api_credentials --token "xoxb-123..."
     """
     try:
-        from af_cli.core.config import get_config
-        
         with get_client() as client:
             # Validate tool name - check for common mistakes
             if tool.lower() == "google":
                 error("❌ Invalid tool name: 'google'")
-                info("")
-                info("Please specify the exact Google Workspace tool:")
-                info("  • google_drive    - Google Drive")
-                info("  • google_docs     - Google Docs")
-                info("  • google_sheets   - Google Sheets")
-                info("  • google_slides   - Google Slides")
-                info("  • gmail           - Gmail")
-                info("  • google_calendar - Google Calendar")
-                info("  • google_meet     - Google Meet")
-                info("  • google_forms    - Google Forms")
-                info("  • google_classroom - Google Classroom")
-                info("  • google_people   - Google People (Contacts)")
-                info("  • google_chat     - Google Chat")
-                info("  • google_tasks    - Google Tasks")
-                info("")
-                info("Example:")
-                info(f"  afctl tools add google_drive --connection-id {connection_id} --method {method}")
+                info(_GOOGLE_TOOL_HELP.format(connection_id=connection_id, method=method))
                 raise typer.Exit(1)
             
             # Validate method
-            if method not in ["api_credentials", "oauth3", "oauth"]:
+            if method not in _VALID_METHODS:
                 error("Method must be 'api_credentials', 'oauth3', or 'oauth'")
                 raise typer.Exit(1)
             
             # Validate oauth3 method is only for Google, Slack, and Notion tools
             if method == "oauth3":
-                if not (tool.startswith("google_") or tool == "gmail" or tool == "slack" or tool == "notion"):
+                if not (_is_google(tool) or tool in _OAUTH3_TOOLS):
                     error("oauth3 method is only available for Google Workspace tools, Slack, and Notion")
                     info("For other tools, use 'api_credentials' method")
                     raise typer.Exit(1)
@@ -486,59 +584,34 @@ def add(
                 
                 if not has_token and not has_oauth_creds:
                     error("api_credentials method requires either:")
-                    info("  • --token (for simple token auth like Notion, Slack bot)")
-                    info("  • --client-id and --client-secret (for OAuth app auth like Google)")
-                    info("")
-                    info(f"Examples:")
-                    info(f"  afctl tools add {tool} --connection-id {connection_id} --method api_credentials --token YOUR_TOKEN")
-                    info(f"  afctl tools add {tool} --connection-id {connection_id} --method api_credentials --client-id ID --client-secret SECRET")
+                    info(_API_CREDENTIALS_HELP.format(tool=tool, connection_id=connection_id))
                     raise typer.Exit(1)
             
-            info(f"Creating connection: {connection_id}")
-            info(f"Tool: {tool}")
-            info(f"Method: {method}")
-            
-            # Step 1: Create connection metadata
-            connection_data = {
-                "tool": tool,
-                "connection_id": connection_id,
-                "display_name": display_name or connection_id,
-                "method": method,
-            }
-            
-            client.post("/api/v1/user-connections", data=connection_data)
-            success(f"✅ Connection entry created: {connection_id}")
-            
-            # Step 2: Store credentials based on method
-            if method == "oauth3":
-                # OAuth3 uses platform credentials - no need to store user credentials
-                success("✅ Connection configured with platform OAuth")
-                info("")
-                info(f"Next: Run 'afctl tools connect {connection_id}' to authenticate")
+            if method == "oauth":
+                # OAuth flow (legacy, redirect to api_credentials)
+                error("The 'oauth' method is deprecated. Please use 'api_credentials' instead.")
+                info("All credential storage now uses the 'api_credentials' method.")
+                raise typer.Exit(1)
             
-            elif method == "api_credentials":
-                # Determine the API base tool name (Google tools all use "google")
-                api_tool_name = "google" if (tool.startswith("google_") or tool == "gmail") else tool
+            # Work out where credentials go before creating anything, so a
+            # local mistake cannot leave a connection entry behind
+            cred_endpoint = None
+            cred_payload = None
+            if method == "api_credentials":
+                api_tool_name, tool_type = _resolve_api_tool(tool, method)
                 
                 if token:
                     # Simple token-based auth (Notion, Slack bot, etc.)
-                    info("Storing API token...")
-                    
                     # Tool-specific endpoint and payload mappings
                     if tool == "notion":
                         # Notion uses /config endpoint with integration_token field
-                        endpoint = f"/api/v1/tools/{tool}/config?connection_id={connection_id}"
+                        cred_endpoint = f"/api/v1/tools/{tool}/config?{urlencode({'connection_id': connection_id})}"
                         cred_payload = {"integration_token": token}
                     else:
                         # Generic tools use /connection endpoint with api_token field
-                        endpoint = f"/api/v1/tools/{tool}/connection?connection_id={connection_id}"
+                        cred_endpoint = f"/api/v1/tools/{tool}/connection?{urlencode({'connection_id': connection_id})}"
                         cred_payload = {"api_token": token}
-                    
-                    client.post(endpoint, data=cred_payload)
-                    success("✅ API token stored")
-                    success(f"✅ Connection '{connection_id}' is ready to use!")
-                    
-                elif client_id and client_secret:
+                else:
                     # OAuth app credentials (Google, Slack app, etc.)
                     # Auto-generate redirect_uri if not provided
                     if not redirect_uri:
@@ -546,41 +619,107 @@ def add(
                         redirect_uri = f"{config.gateway_url}/api/v1/tools/{api_tool_name}/oauth/callback"
                         info(f"Using default redirect URI: {redirect_uri}")
                     
-                    # Store OAuth app config
-                    info("Storing OAuth app credentials...")
-                    config_payload = {
+                    cred_payload = {
                         "client_id": client_id,
                         "client_secret": client_secret,
+                        "redirect_uri": redirect_uri,
                     }
-                    if redirect_uri:
-                        config_payload["redirect_uri"] = redirect_uri
                     
                     # For Google tools, pass tool_type parameter to prevent duplicates
-                    tool_type_param = f"&tool_type={tool}" if api_tool_name == "google" else ""
-                    
-                    client.post(
-                        f"/api/v1/tools/{api_tool_name}/config?connection_id={connection_id}{tool_type_param}",
-                        data=config_payload
-                    )
+                    query = {"connection_id": connection_id}
+                    if tool_type:
+                        query["tool_type"] = tool_type
+                    cred_endpoint = f"/api/v1/tools/{api_tool_name}/config?{urlencode(query)}"
+            
+            info(f"Creating connection: {connection_id}")
+            info(f"Tool: {tool}")
+            info(f"Method: {method}")
+            
+            # Step 1: Create connection metadata
+            connection_data = {
+                "tool": tool,
+                "connection_id": connection_id,
+                "display_name": display_name or connection_id,
+                "method": method,
+            }
+            
+            client.post("/api/v1/user-connections", data=connection_data)
+            invalidate_connections()
+            success(f"✅ Connection entry created: {connection_id}")
+            
+            # Step 2: Store credentials based on method
+            if cred_endpoint:
+                info("Storing API token..." if token else "Storing OAuth app credentials...")
+                ok, status, response = client.try_post(cred_endpoint, cred_payload)
+                
+                if not ok:
+                    detail = response.get("detail") if isinstance(response, dict) else None
+                    error(f"Failed to store credentials: {detail or f'HTTP {status}'}")
+                    # Roll back so the connection is not left without credentials
+                    client.delete(f"/api/v1/user-connections/{connection_id}")
+                    info(f"Connection entry '{connection_id}' was removed. Fix the credentials and try again.")
+                    raise typer.Exit(1)
+            
+            # Connections that still need 'afctl tools connect' are remembered
+            # so that command can skip looking the connection up again
+            if method == "oauth3" or not token:
+                remember_added_connection(client, connection_data)
+            
+            # Print the summary in one write to the terminal
+            with console:
+                if method == "oauth3":
+                    # OAuth3 uses platform credentials - no need to store user credentials
+                    success("✅ Connection configured with platform OAuth")
+                    info("")
+                    info(f"Next: Run 'afctl tools connect {connection_id}' to authenticate")
+                elif token:
+                    success("✅ API token stored")
+                    success(f"✅ Connection '{connection_id}' is ready to use!")
+                else:
                     success("✅ OAuth app credentials stored")
                     info("")
                     info(f"Next: Run 'afctl tools connect {connection_id}' to complete OAuth setup")
+                
+                # Show helpful info
+                info("")
+                info("View your connections:")
+                info(f"  • List all: afctl tools list")
+                info(f"  • View details: afctl tools get {connection_id}")
             
-            elif method == "oauth":
-                # OAuth flow (legacy, redirect to api_credentials)
-                error("The 'oauth' method is deprecated. Please use 'api_credentials' instead.")
-                info("All credential storage now uses the 'api_credentials' method.")
-                raise typer.Exit(1)
-            
-            # Show helpful info
-            info("")
-            info("View your connections:")
-            info(f"  • List all: afctl tools list")
-            info(f"  • View details: afctl tools get {connection_id}")
-            
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to add connection: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
+
+
+# OAuth completion polling for 'afctl tools connect' (seconds)
+_CONNECT_TIMEOUT = 120
+_POLL_INITIAL_DELAY = 0.25
+_POLL_MAX_DELAY = 2.0
+
+
+def _wait_for_connection(client, connection_id: str):
+    """
+    Poll until a connection reports connected, or until _CONNECT_TIMEOUT.
+
+    The first check runs right away, so an authorization that completes
+    while the browser opens (e.g. an existing session) is seen immediately.
+    Later checks back off from quick retries to one every couple of seconds.
+    Returns the connected connection, or None on timeout.
+    """
+    deadline = time.monotonic() + _CONNECT_TIMEOUT
+    delay = _POLL_INITIAL_DELAY
+    while True:
+        conn = find_connection(client, connection_id, refresh=True)
+        if conn and conn.get("connected"):
+            return conn
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, _POLL_MAX_DELAY)
 
 
 @app.command()
@@ -591,17 +730,13 @@ def connect(
     """Complete OAuth connection (open browser for authorization)."""
     try:
         import webbrowser
-        import time
         
         with get_client() as client:
-            # Get connection info
-            connections = client.get("/api/v1/user-connections")
-            
-            connection = None
-            for conn in connections:
-                if conn.get("connection_id") == connection_id:
-                    connection = conn
-                    break
+            # Get connection info (skipping the lookup right after 'tools add')
+            connection = (
+                recently_added_connection(client, connection_id)
+                or find_connection(client, connection_id)
+            )
             
             if not connection:
                 error(f"Connection '{connection_id}' not found")
@@ -619,31 +754,25 @@ def connect(
                     if not confirm:
                         return
             
-            # Determine the API base tool name
-            # - Google tools all use "google" for API credentials, "google_oauth" for oauth3
-            # - Notion uses "notion" for API credentials, "notion_oauth" for oauth3
-            if tool.startswith("google_") or tool == "gmail":
-                api_tool_name = "google_oauth" if method == "oauth3" else "google"
-            elif tool == "notion":
-                api_tool_name = "notion_oauth" if method == "oauth3" else "notion"
-            else:
-                api_tool_name = tool
+            api_tool_name, tool_type = _resolve_api_tool(tool, method)
             
             # Initiate OAuth flow
             info(f"Initiating OAuth for {tool}...")
             
+            query = {"connection_id": connection_id}
             # For Google tools, pass the specific tool_type parameter
-            tool_type_param = f"&tool_type={tool}" if (tool.startswith("google_") or tool == "gmail") else ""
-            
+            if tool_type:
+                query["tool_type"] = tool_type
             # For oauth3 method, pass the method parameter to use platform credentials
-            method_param = f"&method={method}" if method == "oauth3" else ""
+            if method == "oauth3":
+                query["method"] = method
             
             result = client.post(
-                f"/api/v1/tools/{api_tool_name}/connect/initiate?connection_id={connection_id}{tool_type_param}{method_param}",
+                f"/api/v1/tools/{api_tool_name}/connect/initiate?{urlencode(query)}",
                 data={}
             )
             
-            debug(f"Backend response: {result}")
+            debug("Backend response: %s", result)
             
             # Different tools use different field names for the auth URL
             auth_url = (
@@ -655,7 +784,7 @@ def connect(
             if not auth_url:
                 error("Failed to get authorization URL from backend")
                 error(f"Response keys: {list(result.keys())}")
-                debug(f"Full response: {result}")
+                debug("Full response: %s", result)
                 raise typer.Exit(1)
             
             info("Opening browser for authentication...")
@@ -666,33 +795,32 @@ def connect(
             webbrowser.open(auth_url)
             
             info("")
-            info("Waiting for authorization...")
-            info("(Complete the login in your browser)")
             
-            # Poll for connection completion
-            max_attempts = 120  # 2 minutes
-            for attempt in range(max_attempts):
-                time.sleep(1)
+            try:
+                with console.status("Waiting for authorization... (complete the login in your browser, Ctrl+C to cancel)"):
+                    conn = _wait_for_connection(client, connection_id)
+            except KeyboardInterrupt:
+                warning("Cancelled while waiting for authorization")
+                info(f"If you finish signing in later, check with 'afctl tools get {connection_id}'")
+                raise typer.Exit(130)
+            
+            if conn:
+                invalidate_connections()
+                # Print the result in one write to the terminal
+                with console:
+                    info("")
+                    success(f"✅ Successfully connected to {tool}!")
+                    
+                    # Show connection details
+                    info(f"Connection ID: {connection_id}")
+                    if conn.get("email"):
+                        info(f"Email: {conn['email']}")
+                    if conn.get("team_name"):
+                        info(f"Team: {conn['team_name']}")
+                    if conn.get("login"):
+                        info(f"GitHub: {conn['login']}")
                 
-                # Check connection status
-                connections = client.get("/api/v1/user-connections")
-                for conn in connections:
-                    if conn.get("connection_id") == connection_id:
-                        if conn.get("connected"):
-                            info("")
-                            success(f"✅ Successfully connected to {tool}!")
-                            
-                            # Show connection details
-                            info(f"Connection ID: {connection_id}")
-                            if conn.get("email"):
-                                info(f"Email: {conn['email']}")
-                            if conn.get("team_name"):
-                                info(f"Team: {conn['team_name']}")
-                            if conn.get("login"):
-                                info(f"GitHub: {conn['login']}")
-                            
-                            return
-                        break
+                return
             
             # Timeout
             error("")
@@ -700,9 +828,11 @@ def connect(
             info("Please try again or check your browser")
             raise typer.Exit(1)
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to connect: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
 
 
 @app.command()
@@ -714,13 +844,7 @@ def disconnect(
     try:
         with get_client() as client:
             # Get connection info
-            connections = client.get("/api/v1/user-connections")
-            
-            connection = None
-            for conn in connections:
-                if conn.get("connection_id") == connection_id:
-                    connection = conn
-                    break
+            connection = find_connection(client, connection_id)
             
             if not connection:
                 error(f"Connection '{connection_id}' not found")
@@ -744,24 +868,30 @@ def disconnect(
                     info("Cancelled")
                     return
             
-            # Determine the API base tool name (Google tools all use "google")
-            api_tool_name = "google" if (tool.startswith("google_") or tool == "gmail") else tool
+            # Credentials are removed from the base tool, whatever the method
+            api_tool_name, tool_type = _resolve_api_tool(tool)
             
+            query = {"connection_id": connection_id}
             # For Google tools, pass tool_type parameter
-            tool_type_param = f"&tool_type={tool}" if api_tool_name == "google" else ""
+            if tool_type:
+                query["tool_type"] = tool_type
             
             # Delete connection credentials
             client.delete(
-                f"/api/v1/tools/{api_tool_name}/connection?connection_id={connection_id}{tool_type_param}"
+                f"/api/v1/tools/{api_tool_name}/connection?{urlencode(query)}"
             )
+            invalidate_connections()
             
-            success(f"✅ Disconnected: {connection_id}")
-            info("Connection entry preserved.")
-            info(f"Run 'afctl tools connect {connection_id}' to reconnect.")
+            with console:
+                success(f"✅ Disconnected: {connection_id}")
+                info("Connection entry preserved.")
+                info(f"Run 'afctl tools connect {connection_id}' to reconnect.")
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to disconnect: {e}")
-        raise typer.Exit(1)
+        raise typer.Exit(1) from e
 
 
 @app.command()
@@ -773,13 +903,7 @@ def remove(
     try:
         with get_client() as client:
             # Get connection info
-            connections = client.get("/api/v1/user-connections")
-            
-            connection = None
-            for conn in connections:
-                if conn.get("connection_id") == connection_id:
-                    connection = conn
-                    break
+            connection = find_connection(client, connection_id)
             
             if not connection:
                 error(f"Connection '{connection_id}' not found")
@@ -798,9 +922,12 @@ def remove(
             
             # Delete connection entry (backend will cascade delete credentials)
             client.delete(f"/api/v1/user-connections/{connection_id}")
+            invalidate_connections()
             
             success(f"✅ Removed: {connection_id}")
             
-    except Exception as e:
+    except typer.Exit:
+        raise
+    except _COMMAND_ERRORS as e:
         error(f"Failed to remove: {e}")
-        raise typer.Exit(1) 
\ No newline at end of file
+        raise typer.Exit(1) from e 
\ No newline at end of file
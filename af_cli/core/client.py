@@ -2,14 +2,15 @@
 HTTP client for communicating with the Agentic Fabric Gateway.
 """
 
-import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
 import typer
 
+from af_cli.core import jsonlib
 from af_cli.core.config import get_config
+from af_cli.core.http import get_http_client
 from af_cli.core.output import debug, error
 
 
@@ -18,11 +19,18 @@ class AFClient:
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or get_config()
-        self.client = httpx.Client(
-            base_url=self.config.gateway_url,
-            timeout=30.0,
-            follow_redirects=True,
-        )
+        # Share the process-wide connection pool unless a custom config is given
+        self._owns_client = config is not None
+        if self._owns_client:
+            self.client = httpx.Client(
+                base_url=self.config.gateway_url,
+                timeout=30.0,
+                follow_redirects=True,
+            )
+        else:
+            self.client = get_http_client()
+        # Last ETag and body per try_get() request, for conditional re-fetches
+        self._validators: Dict[Tuple[str, Any], Tuple[str, Any]] = {}
     
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for requests."""
@@ -30,7 +38,7 @@ class AFClient:
     
     def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
         """Handle HTTP response."""
-        debug(f"Response: {response.status_code} {response.url}")
+        debug("Response: %s %s", response.status_code, response.url)
         
         if response.status_code == 401:
             error("Authentication failed. Please run 'afctl auth login'")
@@ -42,22 +50,24 @@ class AFClient:
         
         if response.status_code >= 400:
             try:
-                error_data = response.json()
+                error_data = jsonlib.loads(response.content)
                 # Try different error message fields (FastAPI uses "detail")
                 error_message = error_data.get("detail") or error_data.get("message") or "Unknown error"
                 error(f"API Error: {error_message}")
                 # Always show full response for debugging
-                debug(f"Response status: {response.status_code}")
-                debug(f"Request URL: {response.url}")
-                debug(f"Full response: {json.dumps(error_data, indent=2)}")
-            except:
+                debug("Response status: %s", response.status_code)
+                debug("Request URL: %s", response.url)
+                if self.config.verbose:
+                    debug("Full response: %s", jsonlib.dumps_pretty(error_data))
+            except (ValueError, AttributeError):
                 error(f"HTTP Error: {response.status_code}")
-                debug(f"Response text: {response.text}")
+                if self.config.verbose:
+                    debug("Response text: %s", response.text)
             raise typer.Exit(1)
         
         try:
-            return response.json()
-        except:
+            return jsonlib.loads(response.content)
+        except ValueError:
             return {"message": "Success"}
     
     def get(self, path: str, params: Optional[Dict] = None) -> Dict[str, Any]:
@@ -66,27 +76,70 @@ class AFClient:
         if params:
             # Show params in debug output
             param_str = "&".join(f"{k}={v}" for k, v in params.items())
-            debug(f"GET {url}?{param_str}")
+            debug("GET %s?%s", url, param_str)
         else:
-            debug(f"GET {url}")
+            debug("GET %s", url)
         
         response = self.client.get(
             path,
             params=params,
             headers=self._get_headers(),
+            follow_redirects=True,
         )
         
         return self._handle_response(response)
     
+    def try_get(self, path: str, params: Optional[Dict] = None) -> tuple[bool, int, Optional[Any]]:
+        """Make GET request without exiting on error. Returns (success, status_code, response_data).
+        
+        Repeated requests send If-None-Match when the gateway supplied an ETag,
+        and a 304 response returns the previously received data.
+        """
+        url = urljoin(self.config.gateway_url, path)
+        debug("GET %s", url)
+        
+        key = (path, tuple(sorted(params.items())) if params else None)
+        headers = self._get_headers()
+        validator = self._validators.get(key)
+        if validator:
+            headers["If-None-Match"] = validator[0]
+        
+        try:
+            response = self.client.get(
+                path,
+                params=params,
+                headers=headers,
+                follow_redirects=True,
+            )
+            
+            debug("Response: %s %s", response.status_code, response.url)
+            
+            if response.status_code == 304 and validator:
+                return True, 304, validator[1]
+            
+            try:
+                data = jsonlib.loads(response.content)
+            except ValueError:
+                data = {"detail": response.text}
+            
+            etag = response.headers.get("ETag")
+            if etag and response.status_code == 200:
+                self._validators[key] = (etag, data)
+            return response.status_code < 400, response.status_code, data
+                
+        except httpx.HTTPError as e:
+            return False, 0, {"detail": str(e)}
+    
     def post(self, path: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make POST request."""
         url = urljoin(self.config.gateway_url, path)
-        debug(f"POST {url}")
+        debug("POST %s", url)
         
         response = self.client.post(
             path,
             json=data,
             headers=self._get_headers(),
+            follow_redirects=True,
         )
         
         return self._handle_response(response)
@@ -94,27 +147,28 @@ class AFClient:
     def try_post(self, path: str, data: Optional[Dict] = None) -> tuple[bool, int, Optional[Dict[str, Any]]]:
         """Make POST request without exiting on error. Returns (success, status_code, response_data)."""
         url = urljoin(self.config.gateway_url, path)
-        debug(f"POST {url}")
+        debug("POST %s", url)
         
         try:
             response = self.client.post(
                 path,
                 json=data,
                 headers=self._get_headers(),
+                follow_redirects=True,
             )
             
-            debug(f"Response: {response.status_code} {response.url}")
+            debug("Response: %s %s", response.status_code, response.url)
             
             if response.status_code >= 400:
                 try:
-                    error_data = response.json()
+                    error_data = jsonlib.loads(response.content)
                     return False, response.status_code, error_data
-                except:
+                except ValueError:
                     return False, response.status_code, {"detail": response.text}
             
             try:
-                return True, response.status_code, response.json()
-            except:
+                return True, response.status_code, jsonlib.loads(response.content)
+            except ValueError:
                 return True, response.status_code, {"message": "Success"}
                 
         except Exception as e:
@@ -123,12 +177,13 @@ class AFClient:
     def put(self, path: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         """Make PUT request."""
         url = urljoin(self.config.gateway_url, path)
-        debug(f"PUT {url}")
+        debug("PUT %s", url)
         
         response = self.client.put(
             path,
             json=data,
             headers=self._get_headers(),
+            follow_redirects=True,
         )
         
         return self._handle_response(response)
@@ -136,18 +191,20 @@ class AFClient:
     def delete(self, path: str) -> Dict[str, Any]:
         """Make DELETE request."""
         url = urljoin(self.config.gateway_url, path)
-        debug(f"DELETE {url}")
+        debug("DELETE %s", url)
         
         response = self.client.delete(
             path,
             headers=self._get_headers(),
+            follow_redirects=True,
         )
         
         return self._handle_response(response)
     
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Close the HTTP client (the shared pool is closed at exit instead)."""
+        if self._owns_client:
+            self.client.close()
     
     def __enter__(self):
         return self
@@ -156,6 +213,13 @@ class AFClient:
         self.close()
 
 
+# Global client instance
+_client: Optional[AFClient] = None
+
+
 def get_client() -> AFClient:
     """Get HTTP client instance."""
-    return AFClient() 
\ No newline at end of file
+    global _client
+    if _client is None:
+        _client = AFClient()
+    return _client
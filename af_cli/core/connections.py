@@ -0,0 +1,186 @@
+"""
+User tool connection lookups for the Agentic Fabric CLI.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import quote
+
+from af_cli.core.output import debug
+
+
+class ConnectionIndex(NamedTuple):
+    """User connections with lookup tables built once per fetch."""
+
+    items: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    by_tool: Dict[str, Dict[str, Any]]
+
+
+# Rows requested when asking the gateway to search for a single connection
+SEARCH_PAGE_SIZE = 10
+
+# Cleared when the gateway rejects GET /api/v1/user-connections/{id} (older
+# gateways only route DELETE there), so later lookups skip straight to search
+_direct_lookup_supported = True
+
+# Connections fetched during this process, keyed by gateway URL
+_connections_cache: Dict[str, ConnectionIndex] = {}
+
+# Connection most recently created by 'afctl tools add', so that a following
+# 'afctl tools connect' can skip fetching the connection list
+_LAST_ADDED_FILE = Path.home() / ".af" / "last_connection.json"
+_LAST_ADDED_MAX_AGE = 600  # seconds
+
+
+def _build_index(connections: List[Dict[str, Any]]) -> ConnectionIndex:
+    """Index connections by ID and by tool (the first match wins, as in a list scan)."""
+    by_id = {}
+    by_tool = {}
+    for conn in connections:
+        by_id.setdefault(conn.get("connection_id"), conn)
+        by_tool.setdefault(conn.get("tool"), conn)
+    return ConnectionIndex(connections, by_id, by_tool)
+
+
+def fetch_connections(client, refresh: bool = False) -> ConnectionIndex:
+    """
+    Get the user's tool connections.
+
+    The list is fetched from the gateway once per process and served from
+    memory afterwards, so commands that resolve several connections (or are
+    called repeatedly from the same process) do not re-download it.
+
+    Args:
+        client: AFClient used to reach the gateway
+        refresh: Bypass the cache and fetch a fresh list
+    """
+    key = client.config.gateway_url
+    if refresh or key not in _connections_cache:
+        _connections_cache[key] = _build_index(client.get("/api/v1/user-connections"))
+    else:
+        debug("Using cached user connections")
+    return _connections_cache[key]
+
+
+def _get_connection(client, connection_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch a single connection by ID, if the gateway supports it."""
+    global _direct_lookup_supported
+    if not _direct_lookup_supported:
+        return None
+    ok, status, data = client.try_get(f"/api/v1/user-connections/{quote(connection_id, safe='')}")
+    if ok and isinstance(data, dict):
+        return data
+    if status == 405:
+        debug("Gateway has no single-connection endpoint, using search")
+        _direct_lookup_supported = False
+    return None
+
+
+def _search_connections(client, query: str) -> ConnectionIndex:
+    """Fetch only the connections the gateway matches for a search query."""
+    ok, status, data = client.try_get(
+        "/api/v1/user-connections",
+        params={"search": query, "page_size": SEARCH_PAGE_SIZE},
+    )
+    if not ok or not isinstance(data, list):
+        debug("Connection search unavailable (%s), using full list", status)
+        return _build_index([])
+    return _build_index(data)
+
+
+def _match(index: ConnectionIndex, connection_id: str, match_tool: bool) -> Optional[Dict[str, Any]]:
+    """Resolve a connection ID (or tool name) against an index."""
+    connection = index.by_id.get(connection_id)
+    if connection is None and match_tool:
+        connection = index.by_tool.get(connection_id)
+    return connection
+
+
+def find_connection(
+    client,
+    connection_id: str,
+    match_tool: bool = False,
+    refresh: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up a single connection by ID.
+
+    When the full list has not been fetched yet (or ``refresh`` is set), the
+    connection is requested directly by ID, then through the gateway's search
+    filter so only a handful of rows come back. The full list is only
+    downloaded if neither returns an exact match.
+
+    Args:
+        client: AFClient used to reach the gateway
+        connection_id: Connection ID to look up
+        match_tool: Also accept a tool name (e.g. 'slack') when no ID matches
+        refresh: Bypass the cache and fetch a fresh list
+    """
+    key = client.config.gateway_url
+    if refresh:
+        _connections_cache.pop(key, None)
+    if key not in _connections_cache:
+        connection = _get_connection(client, connection_id)
+        if connection is None:
+            connection = _match(_search_connections(client, connection_id), connection_id, match_tool)
+        if connection is not None:
+            return connection
+    return _match(fetch_connections(client), connection_id, match_tool)
+
+
+def remember_added_connection(client, connection: Dict[str, Any]) -> None:
+    """Record a connection just created by 'afctl tools add'."""
+    state = {
+        **connection,
+        "gateway_url": client.config.gateway_url,
+        "added_at": time.time(),
+    }
+    tmp_file = _LAST_ADDED_FILE.with_suffix(".tmp")
+    try:
+        _LAST_ADDED_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(state))
+        os.replace(tmp_file, _LAST_ADDED_FILE)
+    except OSError:
+        pass
+
+
+def recently_added_connection(client, connection_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a connection recorded by remember_added_connection().
+
+    Returns None unless the record is for the same connection and gateway and
+    is recent. The record is deleted once it matches, so only the first
+    'afctl tools connect' after 'afctl tools add' trusts it; a retry after a
+    timed-out or cancelled connect looks the connection up again, since it
+    may have been authorized in the meantime.
+    """
+    try:
+        state = json.loads(_LAST_ADDED_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("connection_id") != connection_id
+        or state.get("gateway_url") != client.config.gateway_url
+        or time.time() - state.get("added_at", 0) > _LAST_ADDED_MAX_AGE
+    ):
+        return None
+    try:
+        _LAST_ADDED_FILE.unlink()
+    except OSError:
+        pass
+    debug("Using connection details saved by 'afctl tools add' for '%s'", connection_id)
+    return {**state, "connected": False}
+
+
+def invalidate_connections() -> None:
+    """Drop cached connections after the user's connections were modified."""
+    _connections_cache.clear()
+    try:
+        _LAST_ADDED_FILE.unlink()
+    except OSError:
+        pass
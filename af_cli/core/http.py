@@ -0,0 +1,53 @@
+"""
+Shared HTTP connection pool for the Agentic Fabric CLI.
+"""
+
+import atexit
+import importlib.util
+from typing import Optional
+
+import httpx
+
+from af_cli.core.config import get_config
+
+# HTTP/2 needs the optional "h2" package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Global HTTP client instance (created on first use, closed at exit)
+_http_client: Optional[httpx.Client] = None
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for the configured gateway.
+
+    The client is created once per process so that repeated requests to the
+    gateway reuse the same TCP connection and TLS session.
+    """
+    global _http_client
+    if _http_client is None:
+        config = get_config()
+        _http_client = httpx.Client(
+            base_url=config.gateway_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client for the configured gateway.
+
+    Async clients are bound to the event loop they are used on, so callers
+    should create one per ``asyncio.run`` and close it when done.
+    """
+    config = get_config()
+    return httpx.AsyncClient(
+        base_url=config.gateway_url,
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+    )
@@ -0,0 +1,45 @@
+"""
+JSON encoding helpers for the Agentic Fabric CLI.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def dumps(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def dumps_pretty(data: Any) -> str:
+    """Serialize data to JSON text indented by two spaces, for display."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(data, indent=2, default=str)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON from bytes or text.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,13 +2,14 @@
 Output formatting utilities for the Agentic Fabric CLI.
 """
 
-import json
-from typing import Any, Dict, List, Optional
+import itertools
+from collections.abc import Iterator
+from typing import Any, Dict, Iterable, List, Optional
 
-import yaml
 from rich.console import Console
 from rich.table import Table
 
+from af_cli.core import jsonlib
 from af_cli.core.config import get_config
 
 console = Console()
@@ -34,26 +35,41 @@ def info(message: str) -> None:
     console.print(f"ℹ️ {message}", style="blue")
 
 
-def debug(message: str) -> None:
-    """Print debug message if verbose mode is enabled."""
+def debug(message: str, *args: Any) -> None:
+    """
+    Print debug message if verbose mode is enabled.
+
+    Any ``args`` are %-formatted into the message only when it is printed,
+    so callers can pass large values without paying to format them otherwise.
+    """
     config = get_config()
     if config.verbose:
+        if args:
+            message = message % args
         console.print(f"🔍 {message}", style="dim")
 
 
 def print_table(
-    data: List[Dict[str, Any]],
+    data: Iterable[Dict[str, Any]],
     columns: Optional[List[str]] = None,
     title: Optional[str] = None,
 ) -> None:
-    """Print data as a table."""
-    if not data:
+    """
+    Print data as a table.
+
+    Rows are dicts keyed by column, or tuples whose values are already in
+    column order (which requires ``columns``). Rows may be produced lazily
+    by a generator.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
         warning("No data to display")
         return
     
     # Use provided columns or infer from first row
     if columns is None:
-        columns = list(data[0].keys())
+        columns = list(first.keys())
     
     # Create table with expand to fill terminal width and show grid lines
     table = Table(title=title, expand=True, show_lines=True)
@@ -63,19 +79,21 @@ def print_table(
         table.add_column(column.replace("_", " ").title(), style="cyan", no_wrap=True)
     
     # Add rows
-    for row in data:
-        table.add_row(*[str(row.get(col, "")) for col in columns])
+    for row in itertools.chain((first,), rows):
+        values = row if isinstance(row, tuple) else [row.get(col, "") for col in columns]
+        table.add_row(*map(str, values))
     
     console.print(table)
 
 
 def print_json(data: Any) -> None:
     """Print data as JSON."""
-    console.print_json(json.dumps(data, indent=2, default=str))
+    console.print_json(jsonlib.dumps_pretty(data))
 
 
 def print_yaml(data: Any) -> None:
     """Print data as YAML."""
+    import yaml  # Deferred: only needed for --format yaml
     console.print(yaml.dump(data, default_flow_style=False))
 
 
@@ -89,12 +107,20 @@ def print_output(
     config = get_config()
     format_type = format_type or config.output_format
     
+    # Serializers need the whole document; tables consume rows as they come
+    if format_type != "table" and isinstance(data, Iterator):
+        data = list(data)
+    
+    # Serialize tuple rows as objects keyed by their column names
+    if format_type != "table" and columns and isinstance(data, list):
+        data = [dict(zip(columns, row)) if isinstance(row, tuple) else row for row in data]
+    
     if format_type == "json":
         print_json(data)
     elif format_type == "yaml":
         print_yaml(data)
     elif format_type == "table":
-        if isinstance(data, list):
+        if isinstance(data, (list, Iterator)):
             print_table(data, columns, title)
         else:
             # Convert single item to table format
@@ -160,7 +186,7 @@ def format_timestamp(timestamp: str) -> str:
         from datetime import datetime
         dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
-    except:
+    except (ValueError, AttributeError, TypeError):
         return timestamp
 
 
@@ -151,14 +151,13 @@ def main(
     The CLI provides commands for managing tool connections and applications
     in your Agentic Fabric deployment.
     """
-    # Configure global options
+    # Configure global options (get_config() loads the default config file once)
     config = get_config()
     
+    # Load configuration from an explicitly requested file
     if config_file:
         config.config_file = config_file
-    
-    # Load configuration
-    config.load()
+        config.load()
     
     # Override with command line options
     if gateway_url:
@@ -5,8 +5,11 @@ Provides utilities for loading application credentials and creating
 authenticated clients.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 import json
+import os
 import httpx
 from typing import Optional, List, Dict
 import logging
@@ -30,6 +33,7 @@ async def get_application_client(
     app_id: str,
     config_dir: Optional[Path] = None,
     gateway_url: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
 ) -> FabriqClient:
     """
     Get authenticated FabriqClient for an application.
@@ -41,6 +45,9 @@ async def get_application_client(
         app_id: Application identifier (e.g., "my-slack-bot")
         config_dir: Optional custom config directory (default: ~/.af)
         gateway_url: Optional gateway URL override (default: from app config)
+        http_client: Optional shared httpx.AsyncClient for the token exchange,
+            e.g. when authenticating several applications (default: a
+            temporary client)
     
     Returns:
         Authenticated FabriqClient instance
@@ -67,7 +74,7 @@ async def get_application_client(
     
     # 2. Exchange credentials for JWT token
     try:
-        async with httpx.AsyncClient() as http:
+        async with nullcontext(http_client) if http_client else httpx.AsyncClient() as http:
             response = await http.post(
                 f"{base_url}/api/v1/applications/token",
                 json={
@@ -82,7 +89,7 @@ async def get_application_client(
                 try:
                     error_json = response.json()
                     error_detail = error_json.get("detail", response.text)
-                except:
+                except (ValueError, AttributeError):
                     pass
                 
                 raise AuthenticationError(
@@ -218,16 +225,26 @@ def list_applications(
     if not app_dir.exists():
         return []
     
-    apps = []
-    for app_file in sorted(app_dir.glob("*.json")):
-        try:
-            with open(app_file, "r") as f:
-                app_config = json.load(f)
-                apps.append(app_config)
-        except Exception as e:
-            logger.warning(f"Failed to load application config from {app_file}: {e}")
+    app_files = sorted(
+        entry.path for entry in os.scandir(app_dir)
+        if entry.name.endswith(".json") and entry.is_file()
+    )
+    
+    if not app_files:
+        return []
     
-    return apps
+    # Read the files concurrently; results keep the sorted file order
+    with ThreadPoolExecutor(max_workers=min(32, len(app_files))) as executor:
+        return [app for app in executor.map(_read_application_file, app_files) if app is not None]
+
+
+def _read_application_file(app_file: str) -> Optional[Dict]:
+    """Read one application config file, logging and skipping unreadable ones."""
+    try:
+        return json.loads(Path(app_file).read_bytes())
+    except Exception as e:
+        logger.warning(f"Failed to load application config from {app_file}: {e}")
+        return None
 
 
 def delete_application_config(
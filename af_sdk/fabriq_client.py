@@ -16,8 +16,10 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
 
+from .transport import jsonlib
 from .transport.http import HTTPClient
 
 
@@ -32,6 +34,9 @@ class FabriqClient:
         retries: Number of retry attempts for transient errors.
         backoff_factor: Exponential backoff base delay in seconds.
         trace_enabled: Enable OpenTelemetry HTTPX instrumentation.
+        cache_ttl: Seconds to reuse ``list_tools`` results for identical
+            arguments. Defaults to 0 (no caching). The cache is cleared by
+            ``invoke_connection``, which may create tools on the Gateway.
     """
 
     def __init__(
@@ -45,6 +50,7 @@ class FabriqClient:
         backoff_factor: float = 0.5,
         trace_enabled: bool = True,
         extra_headers: Optional[Dict[str, str]] = None,
+        cache_ttl: float = 0.0,
     ) -> None:
         self._root = base_url.rstrip("/")
         self._api = api_prefix if api_prefix.startswith("/") else f"/{api_prefix}"
@@ -57,6 +63,8 @@ class FabriqClient:
             auth_token=auth_token,
             trace_enabled=trace_enabled,
         )
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
 
     async def __aenter__(self) -> "FabriqClient":
         return self
@@ -67,15 +75,40 @@ class FabriqClient:
     async def close(self) -> None:
         await self._http.close()
 
+    def clear_cache(self) -> None:
+        """Drop cached listing results so the next call hits the Gateway."""
+        self._cache.clear()
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Optional[bytes]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        return value
+
+    def _cache_put(self, key: Tuple[Any, ...], value: bytes) -> None:
+        if self._cache_ttl > 0:
+            self._cache[key] = (time.monotonic() + self._cache_ttl, value)
+
     # -----------------
     # Tools
     # -----------------
     async def list_tools(self, *, page: int = 1, page_size: int = 20, search: Optional[str] = None) -> Dict[str, Any]:
+        key = ("list_tools", page, page_size, search)
+        # The raw body is cached and decoded per call, so callers that
+        # modify the result cannot affect later cache hits
+        cached = self._cache_get(key)
+        if cached is not None:
+            return jsonlib.loads(cached)
         params: Dict[str, Any] = {"page": page, "page_size": page_size}
         if search:
             params["search"] = search
         r = await self._http.get("/tools", params=params, headers=self._extra_headers)
-        return r.json()
+        self._cache_put(key, r.content)
+        return jsonlib.loads(r.content)
 
     async def invoke_connection(
         self,
@@ -111,13 +144,16 @@ class FabriqClient:
             "parameters": parameters or {},
         }
         
+        # Invoking can auto-create the tool, so cached listings are stale
+        self._cache.clear()
+        
         # Call the connection-based invoke endpoint
         r = await self._http.post(
             f"/tools/connections/{connection_id}/invoke",
             json=body,
             headers=self._extra_headers
         )
-        return r.json()
+        return jsonlib.loads(r.content)
 
     # -----------------
     # Secrets (Gateway-backed Vault)
@@ -125,7 +161,7 @@ class FabriqClient:
     async def get_secret(self, *, path: str, version: Optional[int] = None) -> Dict[str, Any]:
         params = {"version": version} if version is not None else None
         r = await self._http.get(f"/secrets/{path}", params=params, headers=self._extra_headers)
-        return r.json()
+        return jsonlib.loads(r.content)
 
     async def create_secret(
         self,
@@ -144,7 +180,7 @@ class FabriqClient:
         if ttl is not None:
             body["ttl"] = ttl
         r = await self._http.post(f"/secrets/{path}", json=body, headers=self._extra_headers)
-        return r.json()
+        return jsonlib.loads(r.content)
 
     async def update_secret(
         self,
@@ -165,10 +201,10 @@ class FabriqClient:
         if ttl is not None:
             body["ttl"] = ttl
         r = await self._http.put(f"/secrets/{path}", json=body, headers=self._extra_headers)
-        return r.json()
+        return jsonlib.loads(r.content)
 
     async def delete_secret(self, *, path: str) -> Dict[str, Any]:
         r = await self._http.delete(f"/secrets/{path}", headers=self._extra_headers)
-        return r.json() if r.content else {"status": "deleted"}
+        return jsonlib.loads(r.content) if r.content else {"status": "deleted"}
 
 
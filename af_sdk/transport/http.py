@@ -3,6 +3,7 @@ HTTP transport layer for Agentic Fabric SDK.
 """
 
 import asyncio
+import importlib.util
 import logging
 import time
 from typing import Any, Dict, Optional
@@ -23,6 +24,9 @@ from ..exceptions import (
     create_exception_from_response,
 )
 
+# HTTP/2 needs the optional "h2" package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class HTTPClient:
     """HTTP client with retries, tracing, and error handling."""
@@ -47,8 +51,11 @@ class HTTPClient:
         self.user_agent = user_agent
         self.trace_enabled = trace_enabled
 
-        # Configure HTTP client
+        # Configure HTTP client. With HTTP/2, concurrent requests (e.g. from
+        # asyncio.gather) are multiplexed over one connection.
         self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60.0),
             timeout=httpx.Timeout(timeout),
             headers={
                 "User-Agent": user_agent,
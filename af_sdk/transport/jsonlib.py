@@ -0,0 +1,27 @@
+"""
+JSON decoding for Agentic Fabric SDK responses.
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize JSON from bytes or text.
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
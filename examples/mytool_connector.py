@@ -4,22 +4,22 @@ Example ToolConnector using SDK auth decorators.
 
 from typing import Any, Dict, Optional
 
-import httpx
-
 from af_sdk.connectors.base import ToolConnector
 from af_sdk.auth.oauth import oauth_required
 
 
 class MyToolConnector(ToolConnector):
     TOOL_ID = "mytool"
+    ITEMS_URL = "https://api.mytool.example/items"
 
     @oauth_required(scopes=["mytool.read"])
     async def list_items(self, *, limit: int = 10, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        # Make an authenticated request; headers contain the Bearer token
-        async with httpx.AsyncClient() as client:
-            r = await client.get("https://api.mytool.example/items", headers=headers, params={"limit": limit})
-            r.raise_for_status()
-            return r.json()
+        # Make an authenticated request; headers contain the Bearer token.
+        # self.session is the connector context's shared AsyncClient, so
+        # repeated calls reuse its pooled keep-alive connections.
+        r = await self.session.get(f"{self.ITEMS_URL}?limit={int(limit)}", headers=headers)
+        r.raise_for_status()
+        return r.json()
 
     async def invoke(self, method: str, **kwargs):
         return await getattr(self, method)(**kwargs)
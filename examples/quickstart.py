@@ -18,6 +18,11 @@ import os
 from af_sdk import FabriqClient
 
 
+async def _run(call):
+    """Start an SDK call and await it."""
+    return await call()
+
+
 async def main():
     """Main function demonstrating SDK usage."""
     
@@ -47,52 +52,60 @@ async def main():
         retries=3
     ) as client:
         
+        # The three listings are independent, so request them concurrently.
+        # Each call is started inside _run() so that any error, including a
+        # method the client does not provide, is reported for that listing
+        # only instead of aborting the others.
+        tools_result, agents_result, servers_result = await asyncio.gather(
+            _run(lambda: client.list_tools(page=1, page_size=10)),
+            _run(lambda: client.list_agents()),
+            _run(lambda: client.list_mcp_servers()),
+            return_exceptions=True,
+        )
+        
         # Example 1: List tools
         print("1️⃣  Listing tools...")
-        try:
-            tools_response = await client.list_tools(page=1, page_size=10)
-            total = tools_response.get("total", 0)
-            tools = tools_response.get("tools", [])
+        if isinstance(tools_result, Exception):
+            print(f"   ❌ Failed: {type(tools_result).__name__}: {tools_result}")
+        else:
+            total = tools_result.get("total", 0)
+            tools = tools_result.get("tools", [])
             
             print(f"   ✅ Found {total} tool(s)")
             for tool in tools[:3]:  # Show first 3
                 print(f"      - {tool.get('name', 'Unknown')}: {tool.get('description', 'No description')[:50]}")
             if total > 3:
                 print(f"      ... and {total - 3} more")
-        except Exception as e:
-            print(f"   ❌ Failed: {type(e).__name__}: {e}")
         
         print()
         
         # Example 2: List agents
         print("2️⃣  Listing agents...")
-        try:
-            agents_response = await client.list_agents()
-            agents = agents_response.get("agents", [])
+        if isinstance(agents_result, Exception):
+            print(f"   ❌ Failed: {type(agents_result).__name__}: {agents_result}")
+        else:
+            agents = agents_result.get("agents", [])
             
             print(f"   ✅ Found {len(agents)} agent(s)")
             for agent in agents[:3]:  # Show first 3
                 print(f"      - {agent.get('name', 'Unknown')}: {agent.get('description', 'No description')[:50]}")
             if len(agents) > 3:
                 print(f"      ... and {len(agents) - 3} more")
-        except Exception as e:
-            print(f"   ❌ Failed: {type(e).__name__}: {e}")
         
         print()
         
         # Example 3: List MCP servers
         print("3️⃣  Listing MCP servers...")
-        try:
-            servers_response = await client.list_mcp_servers()
-            servers = servers_response.get("servers", [])
+        if isinstance(servers_result, Exception):
+            print(f"   ❌ Failed: {type(servers_result).__name__}: {servers_result}")
+        else:
+            servers = servers_result.get("servers", [])
             
             print(f"   ✅ Found {len(servers)} MCP server(s)")
             for server in servers[:3]:  # Show first 3
                 print(f"      - {server.get('name', 'Unknown')}: {server.get('base_url', 'No URL')}")
             if len(servers) > 3:
                 print(f"      ... and {len(servers) - 3} more")
-        except Exception as e:
-            print(f"   ❌ Failed: {type(e).__name__}: {e}")
         
         print()
         print("=" * 60)
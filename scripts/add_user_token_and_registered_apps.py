@@ -15,17 +15,26 @@ def migrate():
     sync_db_url = DATABASE_URL.replace('postgresql+asyncpg://', 'postgresql+psycopg2://')
     engine = create_engine(sync_db_url)
     
-    with engine.connect() as connection:
+    # One transaction for the whole migration: Postgres DDL is transactional,
+    # so either every change is applied with a single commit or none are
+    with engine.begin() as connection:
         print("\n✅ Connected to database")
         
+        # Snapshot the columns of the tables this migration touches with a
+        # single catalog query; tables that do not exist are absent
         inspector = inspect(connection)
+        schema = {
+            table: {col['name'] for col in columns}
+            for (_, table), columns in inspector.get_multi_columns(
+                filter_names=['tool_credentials', 'registered_applications']
+            ).items()
+        }
         
         # Part 1: Add user token columns to tool_credentials
         print("\n📋 Part 1: Checking tool_credentials table...")
         
-        if 'tool_credentials' in inspector.get_table_names():
-            columns = inspector.get_columns('tool_credentials')
-            column_names = [col['name'] for col in columns]
+        if 'tool_credentials' in schema:
+            column_names = schema['tool_credentials']
             
             new_columns = {
                 'user_access_token': 'TEXT',
@@ -35,23 +44,23 @@ def migrate():
                 'user_id_slack': 'VARCHAR',
             }
             
-            added_count = 0
-            for col_name, col_type in new_columns.items():
-                if col_name not in column_names:
-                    print(f"   Adding column: {col_name}")
-                    connection.execute(text(f"ALTER TABLE tool_credentials ADD COLUMN {col_name} {col_type} NULL"))
-                    added_count += 1
+            missing = [(col_name, col_type) for col_name, col_type in new_columns.items() if col_name not in column_names]
             
-            if added_count > 0:
-                connection.commit()
-                print(f"\n   ✅ Added {added_count} new column(s)")
+            if missing:
+                for col_name, _ in missing:
+                    print(f"   Adding column: {col_name}")
+                # One ALTER TABLE with several ADD COLUMN clauses: a single
+                # round trip and a single lock on the table
+                add_clauses = ", ".join(f"ADD COLUMN {col_name} {col_type} NULL" for col_name, col_type in missing)
+                connection.execute(text(f"ALTER TABLE tool_credentials {add_clauses}"))
+                print(f"\n   ✅ Added {len(missing)} new column(s)")
             else:
                 print(f"\n   ✅ All columns already exist")
         
         # Part 2: Create registered_applications table
         print("\n📋 Part 2: Checking registered_applications table...")
         
-        if 'registered_applications' not in inspector.get_table_names():
+        if 'registered_applications' not in schema:
             print("   Creating table...")
             
             create_table_sql = """
@@ -68,13 +77,14 @@ def migrate():
             """
             connection.execute(text(create_table_sql))
             
-            # Create indexes
-            connection.execute(text("CREATE INDEX ix_registered_applications_id ON registered_applications (id)"))
-            connection.execute(text("CREATE UNIQUE INDEX ix_registered_applications_app_id ON registered_applications (app_id)"))
-            connection.execute(text("CREATE INDEX ix_registered_applications_user_id ON registered_applications (user_id)"))
-            connection.execute(text("CREATE INDEX ix_registered_applications_tenant_id ON registered_applications (tenant_id)"))
+            # Create indexes (sent to the server as one multi-statement batch)
+            connection.exec_driver_sql(
+                "CREATE INDEX ix_registered_applications_id ON registered_applications (id);"
+                " CREATE UNIQUE INDEX ix_registered_applications_app_id ON registered_applications (app_id);"
+                " CREATE INDEX ix_registered_applications_user_id ON registered_applications (user_id);"
+                " CREATE INDEX ix_registered_applications_tenant_id ON registered_applications (tenant_id)"
+            )
             
-            connection.commit()
             print("   ✅ Table created")
         else:
             print("   ✅ Table already exists")